@@ -0,0 +1,102 @@
+"""
+Compiled Numeric Kernels for Test Case Hot Paths
+
+The functions here work on raw NumPy arrays with no pandas in the loop,
+so Numba can JIT-compile them when it is installed. Numba is optional
+(same pattern as tsdownsample in dashboard.py): without it the kernels
+still run as plain Python/NumPy, and the checkers only route work here
+when the compiled versions are available.
+
+Author: ACC Test Suite
+Version: 1.0.0
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator so the kernels stay importable without Numba."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorate(func):
+            return func
+
+        return decorate
+
+
+@njit(cache=True)
+def threshold_mask(values: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Strictly-greater-than scan used by the overspeed and timeout checks.
+
+    Args:
+        values: Array of samples (speeds, or message intervals)
+        threshold: Limit to compare against
+
+    Returns:
+        Boolean array, True where the sample exceeds the threshold
+    """
+    return values > threshold
+
+
+@njit(cache=True)
+def emergency_scan(speed_t: np.ndarray, speed_v: np.ndarray,
+                   brake_t: np.ndarray, brake_v: np.ndarray,
+                   brake_threshold: float, decel_threshold: float,
+                   tolerance: float):
+    """
+    Single-pass emergency stop scan over sorted speed and brake arrays.
+
+    Computes the backward-difference deceleration of the speed series
+    and walks both arrays with two pointers, matching each hard-braking
+    sample to the nearest-in-time speed sample within the tolerance -
+    the same pairing pd.merge_asof(direction='nearest') produces, but
+    in O(N+M) compiled code with no intermediate frames.
+
+    Args:
+        speed_t: Speed timestamps, sorted ascending
+        speed_v: Speed values aligned with speed_t
+        brake_t: Brake pressure timestamps, sorted ascending
+        brake_v: Brake pressure values aligned with brake_t
+        brake_threshold: Minimum pressure for hard braking
+        decel_threshold: Minimum deceleration for an emergency stop
+        tolerance: Maximum |speed_t - brake_t| for a valid match
+
+    Returns:
+        Tuple of (emergency mask over brake samples, matched
+        deceleration per brake sample, NaN where unmatched)
+    """
+    n = speed_t.shape[0]
+    m = brake_t.shape[0]
+
+    decel = np.empty(n, dtype=np.float64)
+    if n > 0:
+        decel[0] = np.nan
+    for i in range(1, n):
+        dt = speed_t[i] - speed_t[i - 1]
+        if dt != 0.0:
+            decel[i] = -(speed_v[i] - speed_v[i - 1]) / dt
+        else:
+            decel[i] = np.nan
+
+    matched = np.full(m, np.nan)
+    mask = np.zeros(m, dtype=np.bool_)
+    j = 0
+    for k in range(m):
+        if n == 0 or brake_v[k] <= brake_threshold:
+            continue
+        t = brake_t[k]
+        while j + 1 < n and abs(speed_t[j + 1] - t) < abs(speed_t[j] - t):
+            j += 1
+        if abs(speed_t[j] - t) <= tolerance:
+            matched[k] = decel[j]
+            if matched[k] > decel_threshold:
+                mask[k] = True
+
+    return mask, matched
@@ -0,0 +1,75 @@
+"""
+Shared Pytest Fixtures for the ACC CAN Test Suite
+
+Session-scoped fixtures for the expensive pipeline stages (DBC load,
+log parse, signal decode, full check run), so each runs exactly once
+per pytest session no matter how many tests consume it. Tests that
+need to mutate the decoded frame should work on their own copy.
+pytest_configure also lives here - pytest only honours it in a
+conftest, not in a test module.
+
+Author: ACC Test Suite
+Version: 1.0.0
+"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from parse_log import load_dbc, parse_asc_log, decode_signals
+from test_cases import compute_derived_features, run_all_tests
+
+
+def pytest_configure(config):
+    """Configure pytest with custom markers."""
+    config.addinivalue_line(
+        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+    )
+
+
+@pytest.fixture(scope="session")
+def project_dir() -> Path:
+    """Get the project directory path."""
+    return Path(__file__).parent
+
+
+@pytest.fixture(scope="session")
+def dbc_path(project_dir: Path) -> Path:
+    """Get the DBC file path."""
+    return project_dir / "acc_signals.dbc"
+
+
+@pytest.fixture(scope="session")
+def log_path(project_dir: Path) -> Path:
+    """Get the sample log file path."""
+    return project_dir / "sample_can_log.asc"
+
+
+@pytest.fixture(scope="session")
+def dbc(dbc_path: Path):
+    """Load the DBC database."""
+    return load_dbc(str(dbc_path))
+
+
+@pytest.fixture(scope="session")
+def raw_messages(log_path: Path):
+    """Parse raw CAN messages from log."""
+    return parse_asc_log(str(log_path))
+
+
+@pytest.fixture(scope="session")
+def decoded_df(raw_messages, dbc) -> pd.DataFrame:
+    """Decode CAN messages to signals DataFrame."""
+    return decode_signals(raw_messages, dbc)
+
+
+@pytest.fixture(scope="session")
+def derived_features(decoded_df):
+    """Compute shared derived features (e.g. speed decel) once."""
+    return compute_derived_features(decoded_df)
+
+
+@pytest.fixture(scope="session")
+def all_test_results(decoded_df, dbc):
+    """Run all tests and cache results."""
+    return run_all_tests(decoded_df, dbc)
@@ -8,6 +8,7 @@ Author: ACC Test Suite
 Version: 1.0.0
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -15,21 +16,110 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 import json
 
-from parse_log import load_dbc, parse_asc_log, decode_signals, get_signal_timeseries
+# Optional: orjson is a much faster C JSON encoder with native NumPy
+# support; the stdlib encoder remains as fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from parse_log import (load_dbc, parse_asc_log, decode_signals,
+                       get_signal_timeseries, build_signal_index)
 from test_cases import run_all_tests, summarize_results, TestResult
 
+# Optional: MinMaxLTTB downsampling keeps visual peaks while cutting
+# the point count handed to Plotly (pip install tsdownsample)
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+    _HAVE_TSDOWNSAMPLE = True
+except ImportError:
+    _HAVE_TSDOWNSAMPLE = False
+
+# Traces below this length are plotted at full resolution
+_DOWNSAMPLE_THRESHOLD = 4000
+# Target point count for downsampled traces
+_DOWNSAMPLE_N_OUT = 2000
+
+
+def _downsample_trace(x: np.ndarray, y: np.ndarray) -> tuple:
+    """
+    Reduce a long trace to ~_DOWNSAMPLE_N_OUT points for plotting.
+
+    Uses MinMaxLTTB when tsdownsample is available; otherwise falls back
+    to per-bucket min/max selection, which also preserves extrema. Short
+    traces are returned unchanged.
+
+    Args:
+        x: Sorted timestamp array
+        y: Signal value array
+
+    Returns:
+        Tuple of (x_plot, y_plot) arrays
+    """
+    if x.size < _DOWNSAMPLE_THRESHOLD:
+        return x, y
+
+    if _HAVE_TSDOWNSAMPLE:
+        keep = MinMaxLTTBDownsampler().downsample(x, y, n_out=_DOWNSAMPLE_N_OUT)
+        return x[keep], y[keep]
 
-def create_signal_plot(df: pd.DataFrame, 
-                       signal_name: str,
+    # Fallback: keep the min and max sample of each bucket
+    bounds = np.linspace(0, x.size, _DOWNSAMPLE_N_OUT // 2 + 1).astype(np.intp)
+    indices = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        if hi > lo:
+            segment = y[lo:hi]
+            indices.append(lo + int(np.argmin(segment)))
+            indices.append(lo + int(np.argmax(segment)))
+    keep = np.unique(np.asarray(indices, dtype=np.intp))
+    return x[keep], y[keep]
+
+
+def _nearest_signal_values(signal_df: pd.DataFrame,
+                           times: List[float],
+                           default: float) -> List[float]:
+    """
+    Look up the signal value nearest in time to each given timestamp.
+
+    One binary search over the sorted series resolves all lookups;
+    `default` is used when the series is empty.
+
+    Args:
+        signal_df: Per-signal DataFrame sorted by timestamp
+        times: Timestamps to resolve
+        default: Value to return when no samples exist
+
+    Returns:
+        List of signal values, one per timestamp
+    """
+    query = np.asarray(times, dtype=np.float64)
+    ts = signal_df['timestamp'].to_numpy(dtype=np.float64)
+
+    if ts.size == 0:
+        return [default] * query.size
+    if ts.size == 1:
+        return [float(signal_df['value'].iloc[0])] * query.size
+
+    vals = signal_df['value'].to_numpy(dtype=np.float64)
+    pos = np.clip(np.searchsorted(ts, query), 1, ts.size - 1)
+    left = pos - 1
+    nearest = np.where(
+        np.abs(ts[left] - query) < np.abs(ts[pos] - query),
+        left, pos
+    )
+    return vals[nearest].tolist()
+
+
+def create_signal_plot(signal_df: pd.DataFrame,
                        display_name: str,
                        unit: str,
-                       color: str) -> go.Scatter:
+                       color: str) -> go.Scattergl:
     """
     Create a Plotly scatter trace for a signal time series.
     
     Args:
-        df: Decoded signals DataFrame
-        signal_name: Signal name in DataFrame
+        signal_df: Per-signal DataFrame with timestamp and value columns
+            (from build_signal_index)
         display_name: Human-readable name for legend
         unit: Unit string for hover text
         color: Line color
@@ -37,14 +127,17 @@ def create_signal_plot(df: pd.DataFrame,
     Returns:
         Plotly Scatter trace
     """
-    signal_df = get_signal_timeseries(df, signal_name)
-    
     if signal_df.empty:
-        return go.Scatter(x=[], y=[], name=display_name)
-    
-    return go.Scatter(
-        x=signal_df['timestamp'],
-        y=signal_df['value'],
+        return go.Scattergl(x=[], y=[], name=display_name)
+
+    x_plot, y_plot = _downsample_trace(
+        signal_df['timestamp'].to_numpy(dtype=np.float64),
+        signal_df['value'].to_numpy(dtype=np.float64)
+    )
+
+    return go.Scattergl(
+        x=x_plot,
+        y=y_plot,
         mode='lines+markers',
         name=display_name,
         line=dict(color=color, width=2),
@@ -57,7 +150,7 @@ def create_signal_plot(df: pd.DataFrame,
 
 def create_violation_markers(results: List[TestResult],
                              y_position: float,
-                             test_name: str) -> go.Scatter:
+                             test_name: str) -> go.Scattergl:
     """
     Create markers for test violations at specific timestamps.
     
@@ -72,10 +165,10 @@ def create_violation_markers(results: List[TestResult],
     # Find the specific test result
     result = next((r for r in results if r.name == test_name), None)
     
-    if not result or not result.timestamps:
-        return go.Scatter(x=[], y=[], name=f"{test_name} Violations")
+    if not result or len(result.timestamps) == 0:
+        return go.Scattergl(x=[], y=[], name=f"{test_name} Violations")
     
-    return go.Scatter(
+    return go.Scattergl(
         x=result.timestamps,
         y=[y_position] * len(result.timestamps),
         mode='markers',
@@ -118,12 +211,25 @@ def generate_dashboard(df: pd.DataFrame,
         ),
         row_heights=[0.28, 0.24, 0.24, 0.24]
     )
+
+    # Index per-signal series once instead of rescanning the DataFrame
+    # for every plot and marker block
+    signal_index = build_signal_index(df)
+    empty_signal = pd.DataFrame(columns=['timestamp', 'value'])
+
+    # Traces are collected and added in one add_traces call at the end,
+    # so Plotly validates and reindexes the subplot grid once
+    traces = []
+    trace_rows = []
+    trace_cols = []
     
     # ========== Speed Plot (Row 1) ==========
-    speed_trace = create_signal_plot(
-        df, 'Speed', 'Vehicle Speed', 'km/h', '#3366CC'
-    )
-    fig.add_trace(speed_trace, row=1, col=1)
+    traces.append(create_signal_plot(
+        signal_index.get('Speed', empty_signal),
+        'Vehicle Speed', 'km/h', '#3366CC'
+    ))
+    trace_rows.append(1)
+    trace_cols.append(1)
     
     # Add overspeed threshold line
     fig.add_hline(
@@ -135,18 +241,15 @@ def generate_dashboard(df: pd.DataFrame,
     
     # Add overspeed violation markers
     overspeed_result = next((r for r in results if r.name == "Overspeed Detection"), None)
-    if overspeed_result and overspeed_result.timestamps:
+    if overspeed_result is not None and len(overspeed_result.timestamps):
         # Get actual speed values at violation times
-        speed_df = get_signal_timeseries(df, 'Speed')
-        violation_speeds = []
-        for t in overspeed_result.timestamps:
-            closest = speed_df.iloc[(speed_df['timestamp'] - t).abs().argsort()[:1]]
-            if not closest.empty:
-                violation_speeds.append(closest['value'].values[0])
-            else:
-                violation_speeds.append(100)
-        
-        fig.add_trace(go.Scatter(
+        violation_speeds = _nearest_signal_values(
+            signal_index.get('Speed', empty_signal),
+            overspeed_result.timestamps,
+            default=100
+        )
+
+        traces.append(go.Scattergl(
             x=overspeed_result.timestamps,
             y=violation_speeds,
             mode='markers',
@@ -154,19 +257,25 @@ def generate_dashboard(df: pd.DataFrame,
             marker=dict(symbol='circle-x', size=14, color='red', 
                        line=dict(width=2, color='darkred')),
             hovertemplate='<b>OVERSPEED!</b><br>Time: %{x:.3f}s<br>Speed: %{y:.1f} km/h<extra></extra>'
-        ), row=1, col=1)
+        ))
+        trace_rows.append(1)
+        trace_cols.append(1)
     
     # ========== Throttle Plot (Row 2) ==========
-    throttle_trace = create_signal_plot(
-        df, 'ThrottlePosition', 'Throttle', '%', '#109618'
-    )
-    fig.add_trace(throttle_trace, row=2, col=1)
+    traces.append(create_signal_plot(
+        signal_index.get('ThrottlePosition', empty_signal),
+        'Throttle', '%', '#109618'
+    ))
+    trace_rows.append(2)
+    trace_cols.append(1)
     
     # ========== Brake Plot (Row 3) ==========
-    brake_trace = create_signal_plot(
-        df, 'BrakePressure', 'Brake Pressure', 'bar', '#DC3912'
-    )
-    fig.add_trace(brake_trace, row=3, col=1)
+    traces.append(create_signal_plot(
+        signal_index.get('BrakePressure', empty_signal),
+        'Brake Pressure', 'bar', '#DC3912'
+    ))
+    trace_rows.append(3)
+    trace_cols.append(1)
     
     # Add emergency brake threshold
     fig.add_hline(
@@ -178,17 +287,15 @@ def generate_dashboard(df: pd.DataFrame,
     
     # Add emergency stop markers
     emergency_result = next((r for r in results if r.name == "Emergency Stop Detection"), None)
-    if emergency_result and emergency_result.timestamps:
-        brake_df = get_signal_timeseries(df, 'BrakePressure')
-        violation_brakes = []
-        for t in emergency_result.timestamps:
-            closest = brake_df.iloc[(brake_df['timestamp'] - t).abs().argsort()[:1]]
-            if not closest.empty:
-                violation_brakes.append(closest['value'].values[0])
-            else:
-                violation_brakes.append(200)
-        
-        fig.add_trace(go.Scatter(
+    if emergency_result is not None and len(emergency_result.timestamps):
+        # Get actual brake pressures at violation times
+        violation_brakes = _nearest_signal_values(
+            signal_index.get('BrakePressure', empty_signal),
+            emergency_result.timestamps,
+            default=200
+        )
+
+        traces.append(go.Scattergl(
             x=emergency_result.timestamps,
             y=violation_brakes,
             mode='markers',
@@ -196,7 +303,9 @@ def generate_dashboard(df: pd.DataFrame,
             marker=dict(symbol='star', size=14, color='orange',
                        line=dict(width=2, color='darkorange')),
             hovertemplate='<b>EMERGENCY STOP!</b><br>Time: %{x:.3f}s<br>Brake: %{y:.0f} bar<extra></extra>'
-        ), row=3, col=1)
+        ))
+        trace_rows.append(3)
+        trace_cols.append(1)
     
     # ========== Test Results Timeline (Row 4) ==========
     test_names = [r.name for r in results]
@@ -204,7 +313,7 @@ def generate_dashboard(df: pd.DataFrame,
     test_statuses = ['PASS ✓' if r.passed else 'FAIL ✗' for r in results]
     
     # Create horizontal bar chart for test results
-    fig.add_trace(go.Bar(
+    traces.append(go.Bar(
         y=test_names,
         x=[1] * len(results),
         orientation='h',
@@ -213,7 +322,11 @@ def generate_dashboard(df: pd.DataFrame,
         textposition='inside',
         hovertemplate='<b>%{y}</b><br>Status: %{text}<extra></extra>',
         showlegend=False
-    ), row=4, col=1)
+    ))
+    trace_rows.append(4)
+    trace_cols.append(1)
+
+    fig.add_traces(traces, rows=trace_rows, cols=trace_cols)
     
     # ========== Layout Configuration ==========
     fig.update_layout(
@@ -259,10 +372,12 @@ def generate_dashboard(df: pd.DataFrame,
         align="left"
     )
     
-    # Save to HTML
+    # Save to HTML. Referencing plotly.js from the CDN keeps the output
+    # ~3 MB smaller and lets the browser cache the library across
+    # reports; use include_plotlyjs='directory' for air-gapped hosts.
     fig.write_html(
         output_path,
-        include_plotlyjs=True,
+        include_plotlyjs='cdn',
         full_html=True,
         config={
             'displayModeBar': True,
@@ -287,10 +402,18 @@ def generate_summary_json(results: List[TestResult],
         Path to generated JSON file
     """
     summary = summarize_results(results)
-    
-    with open(output_path, 'w') as f:
-        json.dump(summary, f, indent=2, default=str)
-    
+
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                summary,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                default=str
+            ))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(summary, f, indent=2, default=str)
+
     return output_path
 
 
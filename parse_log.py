@@ -8,23 +8,51 @@ Author: ACC Test Suite
 Version: 1.0.0
 """
 
+import functools
+import hashlib
+import math
+import mmap
+import os
 import re
+import numpy as np
 import pandas as pd
 import cantools
+from array import array
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 
+# Directory for cached decoded DataFrames (relative to the working dir)
+_CACHE_DIR = Path('.cache')
+
+# Below this many frames, process startup and IPC cost more than the
+# parallel decode saves
+_PARALLEL_MIN_MESSAGES = 50_000
+
+
+@functools.lru_cache(maxsize=8)
+def _load_dbc_cached(dbc_path: str, mtime: float) -> cantools.database.Database:
+    """Parse a DBC file, memoized on (path, mtime)."""
+    return cantools.database.load_file(dbc_path)
+
 
 def load_dbc(dbc_path: str) -> cantools.database.Database:
     """
     Load a DBC (CAN Database) file using cantools.
-    
+
+    Results are memoized on the file's path and mtime, so the repeated
+    loads across run_all.py, the dashboard, and the pytest fixtures
+    parse the DBC only once per process (and re-parse if the file is
+    replaced).
+
     Args:
         dbc_path: Path to the DBC file
-        
+
     Returns:
         cantools Database object
-        
+
     Raises:
         FileNotFoundError: If DBC file doesn't exist
         cantools.database.errors.Error: If DBC parsing fails
@@ -32,83 +60,185 @@ def load_dbc(dbc_path: str) -> cantools.database.Database:
     path = Path(dbc_path)
     if not path.exists():
         raise FileNotFoundError(f"DBC file not found: {dbc_path}")
-    
-    return cantools.database.load_file(str(path))
+
+    return _load_dbc_cached(str(path), path.stat().st_mtime)
+
+
+# Header/non-data line prefixes skipped by the parser
+_SKIP_PREFIXES = ('date', 'base', 'internal', 'Begin', 'End')
+
+# Pre-bound for the per-line hot path
+_bytes_fromhex = bytes.fromhex
+
+# Fallback pattern for ASC data lines the tokenizer doesn't recognize,
+# compiled once so per-call re-cache lookups don't hit the hot loop.
+# Matches: timestamp channel id Tx/Rx d dlc data_bytes...
+_ASC_RE = re.compile(
+    r'^\s*(\d+\.?\d*)\s+\d+\s+([0-9A-Fa-f]+)\s+(?:Tx|Rx)\s+d\s+(\d+)\s+'
+    r'((?:[0-9A-Fa-f]{2}\s*)+)'
+)
 
 
 def parse_asc_line(line: str) -> Optional[Tuple[float, int, bytes]]:
     """
     Parse a single line from an ASC log file.
-    
+
     ASC format: timestamp channel id Tx/Rx d dlc byte0 byte1 ... byte7
     Example: 0.010000 1  100             Tx   d 8 E8 03 01 00 00 00 00 00
-    
+
     Args:
         line: Single line from ASC file
-        
+
     Returns:
         Tuple of (timestamp, can_id, data_bytes) or None if not a data line
     """
     # Skip header lines, comments, and non-data lines
     line = line.strip()
-    if not line or line.startswith('date') or line.startswith('base') or \
-       line.startswith('internal') or line.startswith('Begin') or \
-       line.startswith('End') or 'Start of' in line:
+    if not line or line.startswith(_SKIP_PREFIXES) or 'Start of' in line:
         return None
-    
-    # Pattern for ASC data lines
-    # Matches: timestamp channel id Tx/Rx d dlc data_bytes...
-    pattern = r'^\s*(\d+\.?\d*)\s+\d+\s+([0-9A-Fa-f]+)\s+(?:Tx|Rx)\s+d\s+(\d+)\s+((?:[0-9A-Fa-f]{2}\s*)+)'
-    
-    match = re.match(pattern, line)
+
+    # Fast path: tokenize with str.split instead of running the regex
+    # engine per line. Data lines have the fixed shape
+    # [timestamp, channel, id, Tx/Rx, 'd', dlc, byte0, ..., byteN, ...]
+    # with trailing ';'-comments safely ignored by the slice below.
+    parts = line.split()
+    if len(parts) >= 6 and parts[3] in ('Tx', 'Rx') and parts[4] == 'd' \
+            and parts[1].isdigit():
+        try:
+            timestamp = float(parts[0])
+            can_id = int(parts[2], 16)
+            dlc = int(parts[5])
+            # Single C-level conversion instead of int(b, 16) per byte
+            data_bytes = _bytes_fromhex(''.join(parts[6:6 + dlc]))
+        except ValueError:
+            return None
+
+        if len(data_bytes) != dlc:
+            return None
+
+        return timestamp, can_id, data_bytes
+
+    # Fallback: regex for lines the tokenizer doesn't recognize
+    match = _ASC_RE.match(line)
     if not match:
         return None
-    
+
     timestamp = float(match.group(1))
     can_id = int(match.group(2), 16)
     dlc = int(match.group(3))
     data_hex = match.group(4).strip().split()
-    
-    # Convert hex bytes to bytes object
-    data_bytes = bytes([int(b, 16) for b in data_hex[:dlc]])
-    
+
+    # Convert hex bytes to bytes object in one C call
+    data_bytes = _bytes_fromhex(''.join(data_hex[:dlc]))
+
     return timestamp, can_id, data_bytes
 
 
+def _iter_asc_records(path: Path) -> Any:
+    """
+    Yield (timestamp, can_id, data) tuples from an ASC log file.
+
+    Shared streaming core for parse_asc_log and load_and_decode_log,
+    so callers can consume records without materializing them all.
+    Lines are read from an mmap of the file, so they are sliced out of
+    the page cache rather than copied through the text-IO layer, and
+    only lines that can be data lines (leading digit) are decoded.
+    """
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file - nothing to parse
+            return
+
+        with mm:
+            for raw in iter(mm.readline, b''):
+                # Data lines always start with a numeric timestamp
+                if not raw.lstrip()[:1].isdigit():
+                    continue
+
+                parsed = parse_asc_line(raw.decode('ascii', 'ignore'))
+                if parsed:
+                    yield parsed
+    finally:
+        os.close(fd)
+
+
 def parse_asc_log(log_path: str) -> List[Dict[str, Any]]:
     """
     Parse an ASC format CAN log file.
-    
+
     Args:
         log_path: Path to ASC log file
-        
+
     Returns:
         List of dictionaries with keys: timestamp, id, data
-        
+
     Raises:
         FileNotFoundError: If log file doesn't exist
     """
     path = Path(log_path)
     if not path.exists():
         raise FileNotFoundError(f"Log file not found: {log_path}")
-    
-    messages = []
-    
-    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-        for line in f:
-            parsed = parse_asc_line(line)
-            if parsed:
-                timestamp, can_id, data = parsed
-                messages.append({
-                    'timestamp': timestamp,
-                    'id': can_id,
-                    'data': data
-                })
-    
-    return messages
+
+    return [
+        {'timestamp': timestamp, 'id': can_id, 'data': data}
+        for timestamp, can_id, data in _iter_asc_records(path)
+    ]
+
+
+# Columnar view of a parsed log: one typed array per field instead of
+# one dict per frame
+RawFrames = namedtuple('RawFrames', ['timestamps', 'ids', 'dlcs', 'data'])
 
 
-def decode_signals(messages: List[Dict[str, Any]], 
+def parse_asc_log_arrays(log_path: str) -> RawFrames:
+    """
+    Parse an ASC log into typed column arrays instead of per-frame dicts.
+
+    parse_asc_log pays a dict allocation per frame; this streams every
+    record into preallocated typed buffers and returns NumPy arrays:
+    float64 timestamps, uint32 IDs, uint8 DLCs and an (N, 8) uint8
+    payload block. Short frames are zero-padded to 8 bytes -
+    data[i, :dlcs[i]].tobytes() reconstructs the exact payload.
+
+    Args:
+        log_path: Path to ASC log file
+
+    Returns:
+        RawFrames namedtuple of column arrays
+
+    Raises:
+        FileNotFoundError: If log file doesn't exist
+    """
+    path = Path(log_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Log file not found: {log_path}")
+
+    timestamps = array('d')
+    ids = array('I')
+    dlcs = array('B')
+    payload = bytearray()
+
+    for timestamp, can_id, data in _iter_asc_records(path):
+        timestamps.append(timestamp)
+        ids.append(can_id)
+        dlcs.append(len(data))
+        payload += data.ljust(8, b'\x00')
+
+    return RawFrames(
+        timestamps=np.frombuffer(timestamps, dtype=np.float64),
+        ids=np.frombuffer(ids, dtype=np.uint32),
+        dlcs=np.frombuffer(dlcs, dtype=np.uint8),
+        data=np.frombuffer(payload, dtype=np.uint8).reshape(-1, 8)
+    )
+
+
+def decode_signals(messages: List[Dict[str, Any]],
                    dbc: cantools.database.Database) -> pd.DataFrame:
     """
     Decode raw CAN messages to physical signal values using DBC.
@@ -120,52 +250,407 @@ def decode_signals(messages: List[Dict[str, Any]],
     Returns:
         DataFrame with columns: timestamp, message_name, signal_name, value, raw_data
     """
-    decoded_data = []
-    
-    for msg in messages:
-        can_id = msg['id']
-        timestamp = msg['timestamp']
-        data = msg['data']
-        
+    return _decode_columnar(
+        [m['timestamp'] for m in messages],
+        [m['id'] for m in messages],
+        [m['data'] for m in messages],
+        dbc
+    )
+
+
+@dataclass(frozen=True)
+class _SignalPlan:
+    """Precomputed unpack parameters for one signal."""
+    name: str
+    shift: int          # right-shift into the frame's 64-bit word
+    mask: int
+    length: int
+    is_signed: bool
+    scale: float
+    offset: float
+    is_little: bool
+    integer: bool       # integral scale/offset -> integer physical values
+    choices: Optional[Dict[int, Any]]
+
+
+def _build_decode_plan(message: Any) -> Optional[Tuple[_SignalPlan, ...]]:
+    """
+    Build a vectorized unpack plan for a message definition.
+
+    Returns None when the message needs the generic cantools decoder:
+    multiplexed messages, floating-point signals, frames longer than
+    8 bytes, or signals that don't fit the 64-bit shift/mask scheme.
+    """
+    try:
+        if message.is_multiplexed():
+            return None
+    except Exception:
+        return None
+
+    if message.length is None or message.length > 8:
+        return None
+
+    plans = []
+    for signal in message.signals:
+        if getattr(signal, 'is_float', False):
+            return None
+        length = signal.length
+        if length <= 0 or length > 63:
+            return None
+
+        if signal.byte_order == 'little_endian':
+            shift = signal.start
+            is_little = True
+        else:
+            # Motorola start bit is the MSB position; translate it to a
+            # right-shift in the big-endian 64-bit word
+            byte_index, bit_index = divmod(signal.start, 8)
+            msb_pos = byte_index * 8 + (7 - bit_index)
+            shift = 64 - msb_pos - length
+            is_little = False
+
+        if shift < 0 or shift + length > 64:
+            return None
+
+        scale = float(signal.scale)
+        offset = float(signal.offset)
+        plans.append(_SignalPlan(
+            name=signal.name,
+            shift=shift,
+            mask=(1 << length) - 1,
+            length=length,
+            is_signed=signal.is_signed,
+            scale=scale,
+            offset=offset,
+            is_little=is_little,
+            integer=scale.is_integer() and offset.is_integer(),
+            choices=dict(signal.choices) if signal.choices else None
+        ))
+
+    return tuple(plans)
+
+
+# Plans per message definition, keyed by identity (message objects live
+# as long as their Database, which load_dbc memoizes)
+_decode_plans: Dict[int, Optional[Tuple[_SignalPlan, ...]]] = {}
+
+
+def _get_decode_plan(message: Any) -> Optional[Tuple[_SignalPlan, ...]]:
+    """Return the cached unpack plan for a message definition."""
+    key = id(message)
+    if key not in _decode_plans:
+        _decode_plans[key] = _build_decode_plan(message)
+    return _decode_plans[key]
+
+
+def _unpack_signal_columns(plans: Tuple[_SignalPlan, ...],
+                           data_block: np.ndarray) -> List[List[Any]]:
+    """
+    Unpack all signals of one message from an (N, 8) uint8 data block.
+
+    Each frame is viewed as a 64-bit word and every signal is extracted
+    with one shift/mask over the whole block, so the per-frame Python
+    decode cost disappears.
+
+    Returns:
+        One list of physical values per signal, each of length N
+    """
+    words_le = data_block.view('<u8').ravel()
+    words_be = None
+
+    columns: List[List[Any]] = []
+    for plan in plans:
+        if plan.is_little:
+            words = words_le
+        else:
+            if words_be is None:
+                words_be = words_le.byteswap()
+            words = words_be
+
+        raw = (words >> np.uint64(plan.shift)) & np.uint64(plan.mask)
+
+        if plan.is_signed:
+            raw = raw.astype(np.int64)
+            raw = np.where(raw & (1 << (plan.length - 1)),
+                           raw - (1 << plan.length), raw)
+
+        if plan.integer:
+            values = (raw.astype(np.int64) * int(plan.scale)
+                      + int(plan.offset)).tolist()
+        else:
+            values = (raw.astype(np.float64) * plan.scale
+                      + plan.offset).tolist()
+
+        if plan.choices is not None:
+            get = plan.choices.get
+            values = [
+                choice if choice is not None else value
+                for choice, value in ((get(r), v) for r, v in
+                                      zip(raw.tolist(), values))
+            ]
+
+        columns.append(values)
+
+    return columns
+
+
+def _decode_columnar(timestamps: Any,
+                     ids: Any,
+                     datas: Any,
+                     dbc: cantools.database.Database) -> pd.DataFrame:
+    """
+    Decode parallel timestamp/id/data sequences to a signals DataFrame.
+
+    Columnar core shared by decode_signals and load_and_decode_log.
+    """
+    # Group frame indices by CAN ID so each ID's message definition is
+    # resolved (and its decode method bound) once instead of per frame.
+    by_id: Dict[int, List[int]] = defaultdict(list)
+    for i, can_id in enumerate(ids):
+        by_id[can_id].append(i)
+
+    # Columnar output buffers - building the DataFrame from these in one
+    # pass avoids the per-row dict allocation and frame fragmentation of
+    # pd.DataFrame(list_of_dicts).
+    out_timestamp: List[float] = []
+    out_message_name: List[str] = []
+    out_message_id: List[int] = []
+    out_signal_name: List[str] = []
+    out_value: List[Any] = []
+    out_raw_data: List[str] = []
+
+    for can_id, indices in by_id.items():
         try:
-            # Find message definition in DBC
             message = dbc.get_message_by_frame_id(can_id)
-            
-            # Decode all signals in the message
-            decoded_signals = message.decode(data)
-            
-            for signal_name, value in decoded_signals.items():
-                decoded_data.append({
-                    'timestamp': timestamp,
-                    'message_name': message.name,
-                    'message_id': can_id,
-                    'signal_name': signal_name,
-                    'value': value,
-                    'raw_data': data.hex()
-                })
-                
         except KeyError:
+            message = None
+
+        if message is None:
             # Message ID not found in DBC - log as unknown
-            decoded_data.append({
-                'timestamp': timestamp,
-                'message_name': 'UNKNOWN',
-                'message_id': can_id,
-                'signal_name': 'raw',
-                'value': None,
-                'raw_data': data.hex()
-            })
-        except Exception as e:
-            # Decoding error - log with error info
-            decoded_data.append({
-                'timestamp': timestamp,
-                'message_name': 'ERROR',
-                'message_id': can_id,
-                'signal_name': 'decode_error',
-                'value': str(e),
-                'raw_data': data.hex()
-            })
-    
-    return pd.DataFrame(decoded_data)
+            for i in indices:
+                out_timestamp.append(timestamps[i])
+                out_message_name.append('UNKNOWN')
+                out_message_id.append(can_id)
+                out_signal_name.append('raw')
+                # NaN, not None: missing values then stay inside the
+                # float machinery (to_numeric, notna, downcasting)
+                out_value.append(np.nan)
+                out_raw_data.append(datas[i].hex())
+            continue
+
+        # Hoist attribute lookups out of the per-frame loop
+        decode = message.decode
+        message_name = message.name
+
+        # Vectorized fast path: when the message has a precomputed
+        # unpack plan and every frame has the expected length, extract
+        # each signal from the whole ID's frames with one shift/mask.
+        plan = _get_decode_plan(message)
+        if plan is not None:
+            frame_datas = [datas[i] for i in indices]
+            msg_len = message.length
+            if all(len(d) == msg_len for d in frame_datas):
+                if msg_len == 8:
+                    payload = b''.join(frame_datas)
+                else:
+                    payload = b''.join(d.ljust(8, b'\0') for d in frame_datas)
+                data_block = np.frombuffer(payload, dtype=np.uint8).reshape(-1, 8)
+
+                columns = _unpack_signal_columns(plan, data_block)
+                signal_names = [p.name for p in plan]
+                n_signals = len(signal_names)
+                n_frames = len(indices)
+
+                out_timestamp.extend(np.repeat(
+                    [timestamps[i] for i in indices], n_signals).tolist())
+                out_message_name.extend([message_name] * (n_frames * n_signals))
+                out_message_id.extend([can_id] * (n_frames * n_signals))
+                out_signal_name.extend(signal_names * n_frames)
+                out_raw_data.extend(np.repeat(
+                    [d.hex() for d in frame_datas], n_signals).tolist())
+                # Interleave frame-major so row order matches the
+                # per-frame decode path
+                for row_values in zip(*columns):
+                    out_value.extend(row_values)
+                continue
+
+        for i in indices:
+            timestamp = timestamps[i]
+            data = datas[i]
+
+            try:
+                decoded_signals = decode(data)
+            except Exception as e:
+                # Decoding error - log with error info
+                out_timestamp.append(timestamp)
+                out_message_name.append('ERROR')
+                out_message_id.append(can_id)
+                out_signal_name.append('decode_error')
+                out_value.append(str(e))
+                out_raw_data.append(data.hex())
+                continue
+
+            raw_hex = data.hex()
+            for signal_name, value in decoded_signals.items():
+                out_timestamp.append(timestamp)
+                out_message_name.append(message_name)
+                out_message_id.append(can_id)
+                out_signal_name.append(signal_name)
+                out_value.append(value)
+                out_raw_data.append(raw_hex)
+
+    df = pd.DataFrame({
+        'timestamp': out_timestamp,
+        'message_name': out_message_name,
+        'message_id': out_message_id,
+        'signal_name': out_signal_name,
+        'value': out_value,
+        'raw_data': out_raw_data
+    })
+
+    # Store the name columns as categories: the handful of distinct
+    # strings shrink to small integer codes, and downstream filters and
+    # groupbys compare codes instead of Python strings.
+    df['message_name'] = df['message_name'].astype('category')
+    df['signal_name'] = df['signal_name'].astype('category')
+
+    # Shrink the value column where the log allows it: purely numeric
+    # logs drop from object/float64 to the narrowest float that holds
+    # the data, halving the bytes the threshold scans pull through
+    # cache. Choice labels and decode-error strings keep object dtype.
+    try:
+        df['value'] = pd.to_numeric(df['value'], downcast='float')
+    except (ValueError, TypeError):
+        pass
+
+    return df
+
+
+@dataclass
+class SignalSeries:
+    """Structure-of-arrays time series for one decoded signal."""
+    name: str
+    message_name: str
+    timestamps: np.ndarray  # float64, sorted ascending
+    values: np.ndarray
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert to a timestamp/value DataFrame for existing callers."""
+        return pd.DataFrame({
+            'timestamp': self.timestamps,
+            'value': self.values
+        })
+
+
+def decode_signals_soa(messages: List[Dict[str, Any]],
+                       dbc: cantools.database.Database
+                       ) -> Dict[str, SignalSeries]:
+    """
+    Decode CAN messages into per-signal arrays keyed by signal name.
+
+    Unlike the long-format DataFrame from decode_signals, this returns
+    contiguous NumPy arrays per signal, so consumers index straight into
+    a SignalSeries instead of re-filtering a tall frame by signal_name.
+    Frames with unknown IDs or decode errors are skipped - this layout
+    is for numeric analysis, not debugging.
+
+    Args:
+        messages: List of parsed CAN messages
+        dbc: cantools Database object
+
+    Returns:
+        Dict mapping signal name to its SignalSeries
+    """
+    by_id: Dict[int, List[int]] = defaultdict(list)
+    for i, msg in enumerate(messages):
+        by_id[msg['id']].append(i)
+
+    ts_lists: Dict[str, List[float]] = defaultdict(list)
+    val_lists: Dict[str, List[Any]] = defaultdict(list)
+    signal_message: Dict[str, str] = {}
+
+    for can_id, indices in by_id.items():
+        try:
+            message = dbc.get_message_by_frame_id(can_id)
+        except KeyError:
+            continue
+
+        decode = message.decode
+        message_name = message.name
+
+        for i in indices:
+            msg = messages[i]
+            try:
+                decoded_signals = decode(msg['data'])
+            except Exception:
+                continue
+
+            timestamp = msg['timestamp']
+            for signal_name, value in decoded_signals.items():
+                ts_lists[signal_name].append(timestamp)
+                val_lists[signal_name].append(value)
+                signal_message[signal_name] = message_name
+
+    series: Dict[str, SignalSeries] = {}
+    for signal_name, ts in ts_lists.items():
+        timestamps = np.asarray(ts, dtype=np.float64)
+        values = np.asarray(val_lists[signal_name])
+        order = np.argsort(timestamps, kind='stable')
+        series[signal_name] = SignalSeries(
+            name=signal_name,
+            message_name=signal_message[signal_name],
+            timestamps=timestamps[order],
+            values=values[order]
+        )
+
+    return series
+
+
+def _decode_chunk(messages: List[Dict[str, Any]], dbc_path: str) -> pd.DataFrame:
+    """Decode one chunk of messages in a worker process."""
+    return decode_signals(messages, load_dbc(dbc_path))
+
+
+def decode_signals_parallel(messages: List[Dict[str, Any]],
+                            dbc_path: str,
+                            max_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Decode CAN messages across a process pool, one chunk per worker.
+
+    Decoding is pure CPU and independent per frame, so large logs scale
+    near-linearly with cores. Small logs fall back to the single-process
+    decode_signals, where pool startup would dominate. Workers load the
+    DBC from its path themselves, so only raw messages cross the
+    process boundary.
+
+    Args:
+        messages: List of parsed CAN messages
+        dbc_path: Path to DBC file (loaded once per worker)
+        max_workers: Worker process count (default: CPU count)
+
+    Returns:
+        DataFrame with decoded signals
+    """
+    n_workers = max_workers or os.cpu_count() or 1
+
+    if n_workers <= 1 or len(messages) < _PARALLEL_MIN_MESSAGES:
+        return decode_signals(messages, load_dbc(dbc_path))
+
+    chunk_size = math.ceil(len(messages) / n_workers)
+    chunks = [messages[i:i + chunk_size]
+              for i in range(0, len(messages), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        parts = list(executor.map(_decode_chunk, chunks,
+                                  [dbc_path] * len(chunks)))
+
+    df = pd.concat(parts, ignore_index=True)
+
+    # Chunks can disagree on category sets; re-unify after concat
+    df['message_name'] = df['message_name'].astype('category')
+    df['signal_name'] = df['signal_name'].astype('category')
+
+    return df
 
 
 def get_signal_timeseries(df: pd.DataFrame, signal_name: str) -> pd.DataFrame:
@@ -184,6 +669,66 @@ def get_signal_timeseries(df: pd.DataFrame, signal_name: str) -> pd.DataFrame:
     return signal_df
 
 
+def build_signal_index(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Group a decoded DataFrame into per-signal time series, keyed by name.
+
+    Each get_signal_timeseries call rescans the whole signal_name column;
+    callers that need several signals (dashboard, test runner) should
+    build this index once and look signals up in O(1).
+
+    Args:
+        df: Decoded signals DataFrame
+
+    Returns:
+        Dict mapping signal name to a DataFrame with timestamp and value
+        columns, sorted by timestamp
+    """
+    if df.empty or 'signal_name' not in df.columns:
+        return {}
+
+    grouped = df.groupby('signal_name', sort=False, observed=True)
+    return {
+        name: sub.sort_values('timestamp').reset_index(drop=True)
+        for name, sub in grouped[['timestamp', 'value']]
+    }
+
+
+def pivot_signals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pivot the long-form decoded DataFrame into a wide signal table.
+
+    The result has one column per signal and a sorted timestamp index,
+    so checks can read a signal as one contiguous column instead of
+    re-filtering the long frame, and signals from the same frame are
+    already aligned row-wise (no merge needed to pair them).
+
+    Args:
+        df: Decoded signals DataFrame
+
+    Returns:
+        DataFrame indexed by timestamp with one column per signal name;
+        empty DataFrame if there is nothing to pivot
+    """
+    if df.empty or 'signal_name' not in df.columns:
+        return pd.DataFrame()
+
+    wide = df.pivot_table(index='timestamp', columns='signal_name',
+                          values='value', aggfunc='last', observed=True)
+    wide = wide.sort_index()
+
+    # Downcast column by column: CAN physical values fit float32, which
+    # halves memory traffic and doubles SIMD width for the vectorized
+    # checks. Columns holding choice labels or error strings stay as-is.
+    for column in wide.columns:
+        try:
+            wide[column] = pd.to_numeric(wide[column], downcast='float')
+        except (ValueError, TypeError):
+            pass
+
+    return wide
+
+
 def get_message_timeseries(df: pd.DataFrame, message_name: str) -> pd.DataFrame:
     """
     Extract all signals for a specific message as time series.
@@ -235,20 +780,91 @@ def calculate_message_intervals(messages: List[Dict[str, Any]],
     return intervals
 
 
-def load_and_decode_log(log_path: str, dbc_path: str) -> pd.DataFrame:
+def _decode_cache_key(log_path: str, dbc_path: str) -> str:
+    """Build a cache key from the log/DBC paths and their mtimes."""
+    stamp = (f"{log_path}{os.path.getmtime(log_path)}"
+             f"{dbc_path}{os.path.getmtime(dbc_path)}")
+    return hashlib.sha1(stamp.encode()).hexdigest()
+
+
+def _read_cached_decode(cache_dir: Path, key: str) -> Optional[pd.DataFrame]:
+    """Return the cached decoded DataFrame for key, or None on miss."""
+    parquet_path = cache_dir / f"{key}.parquet"
+    if parquet_path.exists():
+        try:
+            return pd.read_parquet(parquet_path)
+        except Exception:
+            pass
+
+    pickle_path = cache_dir / f"{key}.pkl"
+    if pickle_path.exists():
+        try:
+            return pd.read_pickle(pickle_path)
+        except Exception:
+            pass
+
+    return None
+
+
+def _write_cached_decode(df: pd.DataFrame, cache_dir: Path, key: str) -> None:
+    """Store a decoded DataFrame, preferring Parquet over pickle."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    parquet_path = cache_dir / f"{key}.parquet"
+    try:
+        # Columnar fast path; needs pyarrow and parquet-compatible dtypes
+        df.to_parquet(parquet_path)
+    except Exception:
+        if parquet_path.exists():
+            parquet_path.unlink()
+        df.to_pickle(cache_dir / f"{key}.pkl")
+
+
+def load_and_decode_log(log_path: str, dbc_path: str,
+                        use_cache: bool = False) -> pd.DataFrame:
     """
     Convenience function to load and decode a CAN log in one step.
-    
+
+    Unlike calling parse_asc_log + decode_signals, this streams records
+    straight from the file into typed arrays (float64 timestamps, uint32
+    IDs) without materializing the intermediate list of message dicts,
+    roughly halving peak memory on large logs.
+
     Args:
         log_path: Path to ASC log file
         dbc_path: Path to DBC file
-        
+        use_cache: Reuse a cached decode from .cache/ when neither the
+            log nor the DBC has changed since it was written
+
     Returns:
         DataFrame with decoded signals
     """
+    path = Path(log_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Log file not found: {log_path}")
+
+    if use_cache:
+        key = _decode_cache_key(log_path, dbc_path)
+        cached = _read_cached_decode(_CACHE_DIR, key)
+        if cached is not None:
+            return cached
+
     dbc = load_dbc(dbc_path)
-    messages = parse_asc_log(log_path)
-    return decode_signals(messages, dbc)
+
+    timestamps = array('d')
+    ids = array('I')
+    datas: List[bytes] = []
+
+    for timestamp, can_id, data in _iter_asc_records(path):
+        timestamps.append(timestamp)
+        ids.append(can_id)
+        datas.append(data)
+
+    df = _decode_columnar(timestamps, ids, datas, dbc)
+
+    if use_cache:
+        _write_cached_decode(df, _CACHE_DIR, key)
+
+    return df
 
 
 if __name__ == "__main__":
@@ -20,7 +20,7 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 
-from parse_log import load_dbc, parse_asc_log, decode_signals
+from parse_log import load_dbc, load_and_decode_log
 from test_cases import run_all_tests, summarize_results
 from dashboard import generate_dashboard, generate_summary_json
 
@@ -40,29 +40,37 @@ def print_banner():
     print(banner)
 
 
-def run_pytest_with_coverage(project_dir: Path) -> bool:
+def run_pytest_with_coverage(project_dir: Path, with_coverage: bool = True) -> bool:
     """
-    Run pytest with coverage reporting.
-    
+    Run pytest, optionally with coverage reporting.
+
     Args:
         project_dir: Path to project directory
-        
+        with_coverage: Collect coverage and write the HTML report;
+            disabling skips the instrumentation and report cost
+
     Returns:
         True if all tests passed, False otherwise
     """
     print("\n" + "=" * 60)
-    print("📋 RUNNING PYTEST WITH COVERAGE")
+    if with_coverage:
+        print("📋 RUNNING PYTEST WITH COVERAGE")
+    else:
+        print("📋 RUNNING PYTEST")
     print("=" * 60)
-    
+
     cmd = [
         sys.executable, "-m", "pytest",
         str(project_dir / "test_acc.py"),
-        "-v",
-        "--cov=.",
-        "--cov-report=html",
-        "--cov-report=term-missing",
-        "--cov-fail-under=80"
+        "-v"
     ]
+    if with_coverage:
+        cmd += [
+            "--cov=.",
+            "--cov-report=html",
+            "--cov-report=term-missing",
+            "--cov-fail-under=80"
+        ]
     
     try:
         result = subprocess.run(
@@ -77,15 +85,18 @@ def run_pytest_with_coverage(project_dir: Path) -> bool:
         return False
 
 
-def run_analysis(log_path: Path, dbc_path: Path, output_dir: Path) -> dict:
+def run_analysis(log_path: Path, dbc_path: Path, output_dir: Path,
+                 skip_dashboard: bool = False) -> dict:
     """
     Run the complete analysis pipeline.
-    
+
     Args:
         log_path: Path to CAN log file
         dbc_path: Path to DBC file
         output_dir: Directory for output files
-        
+        skip_dashboard: Skip HTML dashboard generation (JSON results
+            are still written)
+
     Returns:
         Summary dictionary with results
     """
@@ -101,14 +112,10 @@ def run_analysis(log_path: Path, dbc_path: Path, output_dir: Path) -> dict:
     for msg in dbc.messages:
         print(f"     • {msg.name} (0x{msg.frame_id:X}): {len(msg.signals)} signals")
     
-    # Parse log
-    print(f"\n   Parsing log: {log_path.name}")
-    messages = parse_asc_log(str(log_path))
-    print(f"   ✓ Parsed {len(messages)} raw CAN messages")
-    
-    # Decode signals
-    print(f"\n   Decoding signals...")
-    df = decode_signals(messages, dbc)
+    # Parse and decode the log; repeat runs against an unchanged
+    # log/DBC pair reuse the decoded DataFrame cached in .cache/
+    print(f"\n   Parsing and decoding log: {log_path.name}")
+    df = load_and_decode_log(str(log_path), str(dbc_path), use_cache=True)
     print(f"   ✓ Decoded {len(df)} signal values")
     
     # Show signal summary
@@ -142,11 +149,14 @@ def run_analysis(log_path: Path, dbc_path: Path, output_dir: Path) -> dict:
     print("\n" + "=" * 60)
     print("📊 GENERATING DASHBOARD")
     print("=" * 60)
-    
-    dashboard_path = output_dir / "test_results_dashboard.html"
-    generate_dashboard(df, results, str(dashboard_path))
-    print(f"\n   ✓ Dashboard: {dashboard_path}")
-    
+
+    if skip_dashboard:
+        print("\n   ⏭️  Skipping dashboard (--no-dashboard flag)")
+    else:
+        dashboard_path = output_dir / "test_results_dashboard.html"
+        generate_dashboard(df, results, str(dashboard_path))
+        print(f"\n   ✓ Dashboard: {dashboard_path}")
+
     json_path = output_dir / "test_results.json"
     generate_summary_json(results, str(json_path))
     print(f"   ✓ JSON Results: {json_path}")
@@ -197,8 +207,27 @@ def main():
         action='store_true',
         help='Skip pytest execution (only run analysis)'
     )
-    
+    parser.add_argument(
+        '--no-coverage',
+        action='store_true',
+        help='Run pytest without coverage instrumentation/report'
+    )
+    parser.add_argument(
+        '--no-dashboard',
+        action='store_true',
+        help='Skip HTML dashboard generation'
+    )
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Fast dev loop: implies --skip-pytest and --no-dashboard'
+    )
+
     args = parser.parse_args()
+
+    if args.fast:
+        args.skip_pytest = True
+        args.no_dashboard = True
     
     # Determine paths
     project_dir = Path(__file__).parent
@@ -223,12 +252,15 @@ def main():
     # Run pytest
     pytest_passed = True
     if not args.skip_pytest:
-        pytest_passed = run_pytest_with_coverage(project_dir)
+        pytest_passed = run_pytest_with_coverage(
+            project_dir, with_coverage=not args.no_coverage
+        )
     else:
         print("\n   ⏭️  Skipping pytest (--skip-pytest flag)")
-    
+
     # Run analysis
-    summary = run_analysis(log_path, dbc_path, project_dir)
+    summary = run_analysis(log_path, dbc_path, project_dir,
+                           skip_dashboard=args.no_dashboard)
     
     # Print final summary
     print_summary(summary, pytest_passed)
@@ -7,17 +7,18 @@ data loading and dependency injection.
 
 Run with: pytest test_acc.py -v --cov=. --cov-report=html
 
+Session fixtures (dbc, raw_messages, decoded_df, ...) live in
+conftest.py.
+
 Author: ACC Test Suite
 Version: 1.0.0
 """
 
 import pytest
 import pandas as pd
-from pathlib import Path
-from typing import Generator, Tuple
 
 # Import project modules
-from parse_log import load_dbc, parse_asc_log, decode_signals
+from parse_log import parse_asc_log_arrays
 from test_cases import (
     check_overspeed,
     check_timeout,
@@ -30,52 +31,6 @@ from test_cases import (
 )
 
 
-# ============================================================================
-# FIXTURES
-# ============================================================================
-
-@pytest.fixture(scope="session")
-def project_dir() -> Path:
-    """Get the project directory path."""
-    return Path(__file__).parent
-
-
-@pytest.fixture(scope="session")
-def dbc_path(project_dir: Path) -> Path:
-    """Get the DBC file path."""
-    return project_dir / "acc_signals.dbc"
-
-
-@pytest.fixture(scope="session")
-def log_path(project_dir: Path) -> Path:
-    """Get the sample log file path."""
-    return project_dir / "sample_can_log.asc"
-
-
-@pytest.fixture(scope="session")
-def dbc(dbc_path: Path):
-    """Load the DBC database."""
-    return load_dbc(str(dbc_path))
-
-
-@pytest.fixture(scope="session")
-def raw_messages(log_path: Path):
-    """Parse raw CAN messages from log."""
-    return parse_asc_log(str(log_path))
-
-
-@pytest.fixture(scope="session")
-def decoded_df(raw_messages, dbc) -> pd.DataFrame:
-    """Decode CAN messages to signals DataFrame."""
-    return decode_signals(raw_messages, dbc)
-
-
-@pytest.fixture(scope="session")
-def all_test_results(decoded_df, dbc):
-    """Run all tests and cache results."""
-    return run_all_tests(decoded_df, dbc)
-
-
 # ============================================================================
 # UNIT TESTS - Parser Module
 # ============================================================================
@@ -107,6 +62,16 @@ class TestParserModule:
         assert 0x101 in message_ids  # Speed
         assert 0x102 in message_ids  # Brake
     
+    def test_log_parses_to_arrays(self, raw_messages, log_path):
+        """Verify the array-based parser matches the dict-based one."""
+        frames = parse_asc_log_arrays(str(log_path))
+        assert len(frames.timestamps) == len(raw_messages)
+        assert frames.data.shape == (len(raw_messages), 8)
+        first = raw_messages[0]
+        assert frames.timestamps[0] == first['timestamp']
+        assert frames.ids[0] == first['id']
+        assert frames.data[0, :frames.dlcs[0]].tobytes() == first['data']
+
     def test_signals_decode_successfully(self, decoded_df):
         """Verify signal decoding produces valid DataFrame."""
         assert not decoded_df.empty
@@ -231,6 +196,15 @@ class TestEmergencyStop:
         # Sample log has emergency braking
         assert not result.passed, "Expected emergency stop in sample log"
     
+    def test_emergency_stop_accepts_derived_features(self, decoded_df,
+                                                     derived_features):
+        """Verify precomputed derived features give the same result."""
+        baseline = check_emergency_stop(decoded_df)
+        with_derived = check_emergency_stop(decoded_df,
+                                            derived=derived_features)
+        assert with_derived.passed == baseline.passed
+        assert list(with_derived.timestamps) == list(baseline.timestamps)
+
     def test_emergency_stop_thresholds_configurable(self, decoded_df):
         """Verify emergency stop thresholds are configurable."""
         # With extreme thresholds, should not detect
@@ -296,6 +270,18 @@ class TestIntegration:
         for result in all_test_results:
             assert isinstance(result, TestResult)
     
+    def test_run_all_tests_does_not_mutate_input(self, decoded_df, dbc):
+        """
+        Verify checkers are side-effect-free.
+
+        The session-scoped all_test_results fixture hands the same
+        decoded frame to every test, so run_all_tests must not modify
+        it in place.
+        """
+        before = decoded_df.copy(deep=True)
+        run_all_tests(decoded_df, dbc)
+        pd.testing.assert_frame_equal(decoded_df, before)
+
     def test_summary_generation(self, all_test_results):
         """Verify summary generation works correctly."""
         summary = summarize_results(all_test_results)
@@ -358,17 +344,6 @@ class TestEdgeCases:
         assert not result.passed  # Should fail - no Speed signal
 
 
-# ============================================================================
-# PYTEST CONFIGURATION
-# ============================================================================
-
-def pytest_configure(config):
-    """Configure pytest with custom markers."""
-    config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
-    )
-
-
 if __name__ == "__main__":
     # Run tests with verbose output and coverage
     pytest.main([
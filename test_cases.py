@@ -9,12 +9,17 @@ Author: ACC Test Suite
 Version: 1.0.0
 """
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Union
 from dataclasses import dataclass
 import cantools
 
+import _kernels
+
 
 @dataclass
 class TestResult:
@@ -23,7 +28,9 @@ class TestResult:
     passed: bool
     message: str
     details: List[Dict[str, Any]]
-    timestamps: List[float]  # Timestamps of violations for visualization
+    # Violation timestamps for visualization; checks may hand over a
+    # NumPy array directly, to_dict converts for serialization
+    timestamps: Union[List[float], np.ndarray]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -33,21 +40,24 @@ class TestResult:
             'message': self.message,
             'details': self.details,
             'violation_count': len(self.timestamps),
-            'timestamps': self.timestamps
+            'timestamps': np.asarray(self.timestamps).tolist()
         }
 
 
-def check_overspeed(df: pd.DataFrame, threshold_kmh: float = 100.0) -> TestResult:
+def check_overspeed(df: pd.DataFrame, threshold_kmh: float = 100.0,
+                    speed_df: pd.DataFrame = None) -> TestResult:
     """
     Test Case 1: Detect overspeed conditions.
-    
+
     Checks if vehicle speed exceeds the defined threshold at any point.
     For ACC systems, overspeed may indicate control system failure.
-    
+
     Args:
         df: Decoded signals DataFrame
         threshold_kmh: Maximum allowed speed in km/h (default: 100)
-        
+        speed_df: Pre-sliced Speed rows (e.g. from a groupby), to skip
+            re-filtering df by signal name
+
     Returns:
         TestResult with pass/fail and violation details
     """
@@ -60,8 +70,9 @@ def check_overspeed(df: pd.DataFrame, threshold_kmh: float = 100.0) -> TestResul
             details=[],
             timestamps=[]
         )
-    
-    speed_df = df[df['signal_name'] == 'Speed'].copy()
+
+    if speed_df is None:
+        speed_df = df[df['signal_name'] == 'Speed']
     
     if speed_df.empty:
         return TestResult(
@@ -72,10 +83,14 @@ def check_overspeed(df: pd.DataFrame, threshold_kmh: float = 100.0) -> TestResul
             timestamps=[]
         )
     
-    # Find overspeed violations
-    violations = speed_df[speed_df['value'] > threshold_kmh]
-    
-    if violations.empty:
+    # Find overspeed violations with a single vectorized comparison
+    # instead of per-row Python branching
+    values = speed_df['value'].to_numpy(dtype=np.float64)
+    timestamps = speed_df['timestamp'].to_numpy(dtype=np.float64)
+    violation_idx = np.flatnonzero(
+        _kernels.threshold_mask(values, threshold_kmh))
+
+    if violation_idx.size == 0:
         return TestResult(
             name="Overspeed Detection",
             passed=True,
@@ -83,25 +98,32 @@ def check_overspeed(df: pd.DataFrame, threshold_kmh: float = 100.0) -> TestResul
             details=[],
             timestamps=[]
         )
-    
-    # Collect violation details
-    details = []
-    for _, row in violations.iterrows():
-        details.append({
-            'timestamp': row['timestamp'],
-            'speed': row['value'],
+
+    # Collect violation details; the excess column is computed as one
+    # array subtraction and tolist() hands back native Python floats
+    violation_ts = timestamps[violation_idx]
+    violation_speeds = values[violation_idx]
+    excesses = violation_speeds - threshold_kmh
+    details = [
+        {
+            'timestamp': t,
+            'speed': v,
             'threshold': threshold_kmh,
-            'excess': row['value'] - threshold_kmh
-        })
-    
-    max_speed = violations['value'].max()
-    
+            'excess': e
+        }
+        for t, v, e in zip(violation_ts.tolist(),
+                           violation_speeds.tolist(),
+                           excesses.tolist())
+    ]
+
+    max_speed = violation_speeds.max()
+
     return TestResult(
         name="Overspeed Detection",
         passed=False,
-        message=f"Overspeed detected: {len(violations)} violations, max {max_speed:.1f} km/h",
+        message=f"Overspeed detected: {violation_idx.size} violations, max {max_speed:.1f} km/h",
         details=details,
-        timestamps=violations['timestamp'].tolist()
+        timestamps=violation_ts
     )
 
 
@@ -133,9 +155,9 @@ def check_timeout(df: pd.DataFrame,
         )
     
     if message_name:
-        msg_df = df[df['message_name'] == message_name].copy()
+        msg_df = df[df['message_name'] == message_name]
     else:
-        msg_df = df.copy()
+        msg_df = df
     
     if msg_df.empty:
         return TestResult(
@@ -146,10 +168,11 @@ def check_timeout(df: pd.DataFrame,
             timestamps=[]
         )
     
-    # Get unique timestamps and sort
-    timestamps = sorted(msg_df['timestamp'].unique())
-    
-    if len(timestamps) < 2:
+    # Get unique timestamps and sort (np.sort on the NumPy array from
+    # unique() - sorted() would build a Python list)
+    timestamps = np.sort(msg_df['timestamp'].unique())
+
+    if timestamps.size < 2:
         return TestResult(
             name="Message Timeout Detection",
             passed=True,
@@ -157,23 +180,13 @@ def check_timeout(df: pd.DataFrame,
             details=[],
             timestamps=[]
         )
-    
-    # Calculate intervals and find timeouts
-    violations = []
-    violation_timestamps = []
-    
-    for i in range(len(timestamps) - 1):
-        interval = timestamps[i + 1] - timestamps[i]
-        if interval > timeout_seconds:
-            violations.append({
-                'start_time': timestamps[i],
-                'end_time': timestamps[i + 1],
-                'gap_duration': interval,
-                'threshold': timeout_seconds
-            })
-            violation_timestamps.append(timestamps[i])
-    
-    if not violations:
+
+    # Calculate all intervals at once and mask out the timeouts
+    intervals = np.diff(timestamps)
+    gap_mask = _kernels.threshold_mask(intervals, timeout_seconds)
+    gap_idx = np.flatnonzero(gap_mask)
+
+    if gap_idx.size == 0:
         return TestResult(
             name="Message Timeout Detection",
             passed=True,
@@ -181,8 +194,19 @@ def check_timeout(df: pd.DataFrame,
             details=[],
             timestamps=[]
         )
-    
-    max_gap = max(v['gap_duration'] for v in violations)
+
+    violations = [
+        {
+            'start_time': float(timestamps[i]),
+            'end_time': float(timestamps[i + 1]),
+            'gap_duration': float(intervals[i]),
+            'threshold': timeout_seconds
+        }
+        for i in gap_idx
+    ]
+    violation_timestamps = timestamps[gap_idx]
+
+    max_gap = intervals[gap_mask].max()
     
     return TestResult(
         name="Message Timeout Detection",
@@ -193,28 +217,70 @@ def check_timeout(df: pd.DataFrame,
     )
 
 
+def compute_derived_features(df: pd.DataFrame,
+                             speed_df: pd.DataFrame = None
+                             ) -> Dict[str, pd.DataFrame]:
+    """
+    Build the derived per-signal features shared by the checks.
+
+    Currently holds 'speed': sorted Speed rows with a decel column
+    (backward-difference deceleration in km/h/s). Compute this once per
+    decoded log and hand it to the checkers via their derived kwarg, so
+    repeated check invocations skip the sort and diff passes.
+
+    Args:
+        df: Decoded signals DataFrame
+        speed_df: Pre-sliced Speed rows, to skip re-filtering df
+
+    Returns:
+        Dict of derived feature DataFrames keyed by feature name
+    """
+    if speed_df is None:
+        if df.empty or 'signal_name' not in df.columns:
+            return {}
+        speed_df = df[df['signal_name'] == 'Speed']
+
+    speed = (speed_df[['timestamp', 'value']]
+             .sort_values('timestamp').reset_index(drop=True))
+    speed['decel'] = -speed['value'].diff() / speed['timestamp'].diff()
+    return {'speed': speed}
+
+
 def check_emergency_stop(df: pd.DataFrame,
                          brake_threshold: int = 200,
-                         decel_threshold_kmh_per_s: float = 20.0) -> TestResult:
+                         decel_threshold_kmh_per_s: float = 20.0,
+                         speed_df: pd.DataFrame = None,
+                         brake_df: pd.DataFrame = None,
+                         derived: Dict[str, pd.DataFrame] = None
+                         ) -> TestResult:
     """
     Test Case 3: Detect emergency stop events.
-    
+
     An emergency stop is characterized by:
     - Brake pressure exceeding threshold (hard braking)
     - Speed deceleration exceeding threshold (rapid slowdown)
-    
+
     Args:
         df: Decoded signals DataFrame
         brake_threshold: Minimum brake pressure for emergency (default: 200 bar)
         decel_threshold_kmh_per_s: Minimum deceleration rate (default: 20 km/h/s)
-        
+        speed_df: Pre-sliced Speed rows, to skip re-filtering df
+        brake_df: Pre-sliced BrakePressure rows, to skip re-filtering df
+        derived: Shared feature table from compute_derived_features, to
+            skip the per-call sort and decel passes
+
     Returns:
         TestResult with emergency stop events detected
     """
-    speed_df = df[df['signal_name'] == 'Speed'][['timestamp', 'value']].copy()
-    brake_df = df[df['signal_name'] == 'BrakePressure'][['timestamp', 'value']].copy()
-    
-    if speed_df.empty or brake_df.empty:
+    if derived is None or 'speed' not in derived:
+        derived = compute_derived_features(df, speed_df=speed_df)
+    speed_df = derived.get('speed')
+
+    if brake_df is None:
+        brake_df = df[df['signal_name'] == 'BrakePressure']
+    brake_df = brake_df[['timestamp', 'value']]
+
+    if speed_df is None or speed_df.empty or brake_df.empty:
         return TestResult(
             name="Emergency Stop Detection",
             passed=True,  # No data = no emergency detected
@@ -222,42 +288,13 @@ def check_emergency_stop(df: pd.DataFrame,
             details=[],
             timestamps=[]
         )
-    
-    speed_df = speed_df.sort_values('timestamp').reset_index(drop=True)
+
     brake_df = brake_df.sort_values('timestamp').reset_index(drop=True)
-    
-    # Calculate speed deceleration (derivative)
-    speed_df['decel'] = -speed_df['value'].diff() / speed_df['timestamp'].diff()
-    
+
     # Find high brake pressure events
     high_brake = brake_df[brake_df['value'] > brake_threshold]
-    
-    violations = []
-    violation_timestamps = []
-    
-    for _, brake_row in high_brake.iterrows():
-        t = brake_row['timestamp']
-        
-        # Find speed readings near this timestamp (within 0.2s)
-        nearby_speed = speed_df[
-            (speed_df['timestamp'] >= t - 0.2) & 
-            (speed_df['timestamp'] <= t + 0.2)
-        ]
-        
-        if not nearby_speed.empty:
-            max_decel = nearby_speed['decel'].max()
-            
-            if pd.notna(max_decel) and max_decel > decel_threshold_kmh_per_s:
-                violations.append({
-                    'timestamp': t,
-                    'brake_pressure': brake_row['value'],
-                    'deceleration': max_decel,
-                    'brake_threshold': brake_threshold,
-                    'decel_threshold': decel_threshold_kmh_per_s
-                })
-                violation_timestamps.append(t)
-    
-    if not violations:
+
+    if high_brake.empty:
         return TestResult(
             name="Emergency Stop Detection",
             passed=True,
@@ -265,7 +302,69 @@ def check_emergency_stop(df: pd.DataFrame,
             details=[],
             timestamps=[]
         )
-    
+
+    if _kernels.HAVE_NUMBA:
+        # One compiled pass computes the deceleration series and matches
+        # each hard-braking sample to the nearest speed sample within
+        # 0.2s - no intermediate frames at all
+        mask, decels = _kernels.emergency_scan(
+            speed_df['timestamp'].to_numpy(dtype=np.float64),
+            speed_df['value'].to_numpy(dtype=np.float64),
+            brake_df['timestamp'].to_numpy(dtype=np.float64),
+            brake_df['value'].to_numpy(dtype=np.float64),
+            float(brake_threshold),
+            float(decel_threshold_kmh_per_s),
+            0.2
+        )
+        event_ts = brake_df['timestamp'].to_numpy()[mask].tolist()
+        event_brake = brake_df['value'].to_numpy()[mask].tolist()
+        event_decel = decels[mask].tolist()
+    else:
+        # Match each hard-braking sample to the nearest-in-time
+        # deceleration sample (within 0.2s): searchsorted finds each
+        # insertion point in the sorted speed timestamps, and the nearer
+        # of its two neighbours wins (earlier sample on ties, like
+        # merge_asof with direction='nearest')
+        speed_t = speed_df['timestamp'].to_numpy(dtype=np.float64)
+        speed_decel = speed_df['decel'].to_numpy(dtype=np.float64)
+        brake_t = high_brake['timestamp'].to_numpy(dtype=np.float64)
+
+        pos = np.searchsorted(speed_t, brake_t)
+        left = np.clip(pos - 1, 0, speed_t.size - 1)
+        right = np.clip(pos, 0, speed_t.size - 1)
+        use_right = (np.abs(speed_t[right] - brake_t)
+                     < np.abs(speed_t[left] - brake_t))
+        nearest = np.where(use_right, right, left)
+
+        within = np.abs(speed_t[nearest] - brake_t) <= 0.2
+        matched = np.where(within, speed_decel[nearest], np.nan)
+        emergency_mask = matched > decel_threshold_kmh_per_s
+
+        event_ts = brake_t[emergency_mask].tolist()
+        event_brake = high_brake['value'].to_numpy()[emergency_mask].tolist()
+        event_decel = matched[emergency_mask].tolist()
+
+    if not event_ts:
+        return TestResult(
+            name="Emergency Stop Detection",
+            passed=True,
+            message="No emergency stop events detected",
+            details=[],
+            timestamps=[]
+        )
+
+    violation_timestamps = event_ts
+    violations = [
+        {
+            'timestamp': t,
+            'brake_pressure': b,
+            'deceleration': d,
+            'brake_threshold': brake_threshold,
+            'decel_threshold': decel_threshold_kmh_per_s
+        }
+        for t, b, d in zip(event_ts, event_brake, event_decel)
+    ]
+
     return TestResult(
         name="Emergency Stop Detection",
         passed=False,  # Emergency stops are detected (test catches the condition)
@@ -275,7 +374,29 @@ def check_emergency_stop(df: pd.DataFrame,
     )
 
 
-def check_signal_bounds(df: pd.DataFrame, 
+@functools.lru_cache(maxsize=8)
+def _build_signal_bounds(dbc: cantools.database.Database
+                         ) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    Build min/max/message lookup Series from a DBC, indexed by signal name.
+
+    Cached per Database object (hashed by identity), so repeated bounds
+    checks against the same DBC skip the walk over cantools objects.
+    """
+    mins = {}
+    maxs = {}
+    messages = {}
+    for message in dbc.messages:
+        for signal in message.signals:
+            mins[signal.name] = (signal.minimum if signal.minimum is not None
+                                 else float('-inf'))
+            maxs[signal.name] = (signal.maximum if signal.maximum is not None
+                                 else float('inf'))
+            messages[signal.name] = message.name
+    return pd.Series(mins), pd.Series(maxs), pd.Series(messages)
+
+
+def check_signal_bounds(df: pd.DataFrame,
                         dbc: cantools.database.Database) -> TestResult:
     """
     Test Case 4: Validate signals are within DBC-defined bounds.
@@ -290,44 +411,7 @@ def check_signal_bounds(df: pd.DataFrame,
     Returns:
         TestResult with out-of-bounds violations
     """
-    violations = []
-    violation_timestamps = []
-    
-    # Build signal bounds lookup from DBC
-    signal_bounds = {}
-    for message in dbc.messages:
-        for signal in message.signals:
-            signal_bounds[signal.name] = {
-                'min': signal.minimum if signal.minimum is not None else float('-inf'),
-                'max': signal.maximum if signal.maximum is not None else float('inf'),
-                'message': message.name
-            }
-    
-    # Check each signal value
-    for _, row in df.iterrows():
-        signal_name = row['signal_name']
-        value = row['value']
-        
-        if signal_name not in signal_bounds:
-            continue
-        
-        if value is None or not isinstance(value, (int, float)):
-            continue
-        
-        bounds = signal_bounds[signal_name]
-        
-        if value < bounds['min'] or value > bounds['max']:
-            violations.append({
-                'timestamp': row['timestamp'],
-                'signal': signal_name,
-                'value': value,
-                'min': bounds['min'],
-                'max': bounds['max'],
-                'message': bounds['message']
-            })
-            violation_timestamps.append(row['timestamp'])
-    
-    if not violations:
+    if df.empty or 'signal_name' not in df.columns:
         return TestResult(
             name="Signal Bounds Validation",
             passed=True,
@@ -335,35 +419,92 @@ def check_signal_bounds(df: pd.DataFrame,
             details=[],
             timestamps=[]
         )
-    
+
+    # Signal bounds lookup from DBC as Series indexed by name (memoized)
+    min_series, max_series, msg_series = _build_signal_bounds(dbc)
+
+    # Reject signals the DBC doesn't define in one isin pass (integer
+    # code membership on the categorical column), so the bounds mapping
+    # below only touches known rows
+    known_mask = df['signal_name'].isin(min_series.index)
+    known = df if known_mask.all() else df.loc[known_mask]
+
+    # Map each known row to its bounds and compare in one vectorized
+    # pass. Non-numeric values (choice labels, decode-error strings)
+    # coerce to NaN and drop out.
+    signal_names = known['signal_name']
+    row_min = signal_names.map(min_series)
+    row_max = signal_names.map(max_series)
+    values = pd.to_numeric(known['value'], errors='coerce')
+
+    oob_mask = (values.notna()
+                & ((values < row_min) | (values > row_max)))
+
+    if not oob_mask.any():
+        return TestResult(
+            name="Signal Bounds Validation",
+            passed=True,
+            message="All signal values within DBC-defined bounds",
+            details=[],
+            timestamps=[]
+        )
+
+    oob = known.loc[oob_mask]
+    oob_names = oob['signal_name'].tolist()
+    violation_ts = oob['timestamp'].to_numpy()
+    violation_timestamps = violation_ts.tolist()
+    violations = [
+        {
+            'timestamp': t,
+            'signal': name,
+            'value': v,
+            'min': min_series[name],
+            'max': max_series[name],
+            'message': msg_series[name]
+        }
+        for t, name, v in zip(violation_timestamps,
+                              oob_names,
+                              values[oob_mask].tolist())
+    ]
+
     return TestResult(
         name="Signal Bounds Validation",
         passed=False,
         message=f"Out-of-bounds violations: {len(violations)} signals",
         details=violations,
-        timestamps=list(set(violation_timestamps))
+        # np.unique is a C-level sort-unique, so the deduplicated
+        # timestamps also come back in a stable ascending order
+        timestamps=np.unique(violation_ts)
     )
 
 
-def check_checksum(df: pd.DataFrame) -> TestResult:
+def check_checksum(df: pd.DataFrame,
+                   brake_pressure: pd.DataFrame = None,
+                   brake_checksum: pd.DataFrame = None) -> TestResult:
     """
     Test Case 5: Validate message checksums.
-    
+
     For the Brake message, validates that BrakeChecksum matches
     the expected XOR checksum of BrakePressure.
-    
+
     Checksum algorithm: BrakeChecksum should equal BrakePressure XOR 0x00
     (simple validation - real checksums would be more complex)
-    
+
     Args:
         df: Decoded signals DataFrame
-        
+        brake_pressure: Pre-sliced BrakePressure rows, to skip re-filtering df
+        brake_checksum: Pre-sliced BrakeChecksum rows, to skip re-filtering df
+
     Returns:
         TestResult with checksum validation results
     """
     # Get brake messages with both pressure and checksum
-    brake_pressure = df[df['signal_name'] == 'BrakePressure'][['timestamp', 'value']].copy()
-    brake_checksum = df[df['signal_name'] == 'BrakeChecksum'][['timestamp', 'value']].copy()
+    if brake_pressure is None:
+        brake_pressure = df[df['signal_name'] == 'BrakePressure']
+    if brake_checksum is None:
+        brake_checksum = df[df['signal_name'] == 'BrakeChecksum']
+    brake_pressure = brake_pressure[['timestamp', 'value']]
+    brake_checksum = brake_checksum[['timestamp', 'value']]
     
     if brake_pressure.empty or brake_checksum.empty:
         return TestResult(
@@ -374,34 +515,35 @@ def check_checksum(df: pd.DataFrame) -> TestResult:
             timestamps=[]
         )
     
-    # Merge on timestamp
-    merged = pd.merge(
-        brake_pressure.rename(columns={'value': 'pressure'}),
-        brake_checksum.rename(columns={'value': 'checksum'}),
-        on='timestamp',
-        how='inner'
-    )
-    
-    violations = []
-    violation_timestamps = []
-    
-    for _, row in merged.iterrows():
-        pressure = int(row['pressure'])
-        checksum = int(row['checksum'])
-        
-        # Expected checksum: pressure value itself (simple echo check)
-        # In real systems, this would be CRC or XOR of multiple bytes
-        expected_checksum = pressure
-        
-        if checksum != expected_checksum:
-            violations.append({
-                'timestamp': row['timestamp'],
-                'pressure': pressure,
-                'checksum': checksum,
-                'expected': expected_checksum
-            })
-            violation_timestamps.append(row['timestamp'])
-    
+    # Both signals come from the same Brake frame, so they already share
+    # timestamps - index alignment pairs them without a merge hash table
+    # or a materialized merged frame
+    pressure = brake_pressure.set_index('timestamp')['value']
+    checksum = brake_checksum.set_index('timestamp')['value']
+    pressure, checksum = pressure.align(checksum, join='inner')
+
+    pressures = pressure.to_numpy(dtype=np.int64)
+    checksums = checksum.to_numpy(dtype=np.int64)
+
+    # Expected checksum: pressure value itself (simple echo check)
+    # In real systems, this would be CRC or XOR of multiple bytes
+    bad_mask = checksums != pressures
+
+    violation_timestamps = pressure.index.to_numpy()[bad_mask].tolist()
+    violations = [
+        {
+            'timestamp': ts,
+            'pressure': int(pressure),
+            'checksum': int(checksum),
+            'expected': int(pressure)
+        }
+        for ts, pressure, checksum in zip(
+            violation_timestamps,
+            pressures[bad_mask],
+            checksums[bad_mask]
+        )
+    ]
+
     if not violations:
         return TestResult(
             name="Checksum Validation",
@@ -420,7 +562,132 @@ def check_checksum(df: pd.DataFrame) -> TestResult:
     )
 
 
-def run_all_tests(df: pd.DataFrame, 
+def check_overspeed_wide(wide: pd.DataFrame,
+                         threshold_kmh: float = 100.0) -> TestResult:
+    """
+    Wide-layout variant of check_overspeed.
+
+    Operates on the pivoted signal table from parse_log.pivot_signals,
+    where Speed is one contiguous column indexed by timestamp.
+
+    Args:
+        wide: Wide DataFrame with one column per signal
+        threshold_kmh: Maximum allowed speed in km/h (default: 100)
+
+    Returns:
+        TestResult with pass/fail and violation details
+    """
+    if wide.empty or 'Speed' not in wide.columns:
+        return TestResult(
+            name="Overspeed Detection",
+            passed=False,
+            message="No speed signal data found in log",
+            details=[],
+            timestamps=[]
+        )
+
+    speed = pd.to_numeric(wide['Speed'], errors='coerce').dropna()
+    values = speed.to_numpy(dtype=np.float64)
+    timestamps = speed.index.to_numpy(dtype=np.float64)
+    violation_idx = np.flatnonzero(values > threshold_kmh)
+
+    if violation_idx.size == 0:
+        return TestResult(
+            name="Overspeed Detection",
+            passed=True,
+            message=f"No overspeed conditions detected (threshold: {threshold_kmh} km/h)",
+            details=[],
+            timestamps=[]
+        )
+
+    violation_ts = timestamps[violation_idx]
+    violation_speeds = values[violation_idx]
+    excesses = violation_speeds - threshold_kmh
+    details = [
+        {
+            'timestamp': t,
+            'speed': v,
+            'threshold': threshold_kmh,
+            'excess': e
+        }
+        for t, v, e in zip(violation_ts.tolist(),
+                           violation_speeds.tolist(),
+                           excesses.tolist())
+    ]
+
+    return TestResult(
+        name="Overspeed Detection",
+        passed=False,
+        message=f"Overspeed detected: {violation_idx.size} violations, "
+                f"max {violation_speeds.max():.1f} km/h",
+        details=details,
+        timestamps=violation_ts.tolist()
+    )
+
+
+def check_checksum_wide(wide: pd.DataFrame) -> TestResult:
+    """
+    Wide-layout variant of check_checksum.
+
+    In the pivoted table BrakePressure and BrakeChecksum are already
+    aligned on the timestamp index, so no merge is needed before the
+    comparison.
+
+    Args:
+        wide: Wide DataFrame with one column per signal
+
+    Returns:
+        TestResult with checksum validation results
+    """
+    if (wide.empty or 'BrakePressure' not in wide.columns
+            or 'BrakeChecksum' not in wide.columns):
+        return TestResult(
+            name="Checksum Validation",
+            passed=True,
+            message="No brake checksum data available for validation",
+            details=[],
+            timestamps=[]
+        )
+
+    both = wide[['BrakePressure', 'BrakeChecksum']].dropna()
+    pressures = both['BrakePressure'].to_numpy(dtype=np.int64)
+    checksums = both['BrakeChecksum'].to_numpy(dtype=np.int64)
+    bad_mask = checksums != pressures
+
+    violation_timestamps = both.index.to_numpy()[bad_mask].tolist()
+    violations = [
+        {
+            'timestamp': ts,
+            'pressure': int(pressure),
+            'checksum': int(checksum),
+            'expected': int(pressure)
+        }
+        for ts, pressure, checksum in zip(
+            violation_timestamps,
+            pressures[bad_mask],
+            checksums[bad_mask]
+        )
+    ]
+
+    if not violations:
+        return TestResult(
+            name="Checksum Validation",
+            passed=True,
+            message="All brake message checksums valid",
+            details=[],
+            timestamps=[]
+        )
+
+    return TestResult(
+        name="Checksum Validation",
+        passed=False,
+        message=f"Checksum errors detected: {len(violations)} invalid messages",
+        details=violations,
+        timestamps=violation_timestamps
+    )
+
+
+def run_all_tests(df: pd.DataFrame,
                   dbc: cantools.database.Database) -> List[TestResult]:
     """
     Run all test cases and return results.
@@ -432,15 +699,38 @@ def run_all_tests(df: pd.DataFrame,
     Returns:
         List of TestResult objects
     """
-    results = [
-        check_overspeed(df),
-        check_timeout(df),
-        check_emergency_stop(df),
-        check_signal_bounds(df, dbc),
-        check_checksum(df)
+    # Slice the frame by signal once; the checks that only need one or
+    # two signals then skip their own equality scans over signal_name
+    if df.empty or 'signal_name' not in df.columns:
+        groups = {}
+    else:
+        groups = {name: group for name, group
+                  in df.groupby('signal_name', observed=True, sort=False)}
+
+    derived = (compute_derived_features(df, speed_df=groups.get('Speed'))
+               if 'Speed' in groups else {})
+
+    # The checks are independent and only read the shared frames, so
+    # run them concurrently on a small thread pool; the NumPy/pandas
+    # kernels they spend their time in release the GIL
+    tasks = [
+        (check_overspeed, (df,),
+         {'speed_df': groups.get('Speed')}),
+        (check_timeout, (df,), {}),
+        (check_emergency_stop, (df,),
+         {'speed_df': groups.get('Speed'),
+          'brake_df': groups.get('BrakePressure'),
+          'derived': derived}),
+        (check_signal_bounds, (df, dbc), {}),
+        (check_checksum, (df,),
+         {'brake_pressure': groups.get('BrakePressure'),
+          'brake_checksum': groups.get('BrakeChecksum')})
     ]
-    
-    return results
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(check, *args, **kwargs)
+                   for check, args, kwargs in tasks]
+        return [future.result() for future in futures]
 
 
 def summarize_results(results: List[TestResult]) -> Dict[str, Any]: